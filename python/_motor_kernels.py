@@ -0,0 +1,44 @@
+"""
+Numeric kernels for the motor animation.
+
+Run this file to build the ahead-of-time compiled `motor_kernels`
+extension module next to it (requires numba):
+
+    python _motor_kernels.py
+
+motorAnimation.py uses the compiled module when it is importable, so no
+JIT compilation happens at runtime. Otherwise it JIT compiles the plain
+Python definitions below with numba, or runs them as-is without numba.
+"""
+import math
+import os
+
+
+def rotor_pose(theta, offsets, r_in, r_out, shaft_r, xi, xo, yi, yo):
+    """
+    Compute the rotor-bar endpoints and the shaft reference-mark tip
+    for rotor angle theta.
+
+    The bar endpoints are written into the preallocated arrays xi, xo
+    (x inner, x outer), yi and yo, one entry per bar offset.
+    Returns the (x, y) tip of the shaft reference mark.
+    """
+    for i in range(offsets.size):
+        c = math.cos(theta + offsets[i])
+        s = math.sin(theta + offsets[i])
+        xi[i] = r_in * c
+        xo[i] = r_out * c
+        yi[i] = r_in * s
+        yo[i] = r_out * s
+    return shaft_r * math.cos(theta), shaft_r * math.sin(theta)
+
+
+if __name__ == '__main__':
+    from numba.pycc import CC
+
+    cc = CC('motor_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export('rotor_pose',
+              'UniTuple(f8, 2)(f8, f8[:], f8, f8, f8, f8[:], f8[:], f8[:], f8[:])'
+              )(rotor_pose)
+    cc.compile()
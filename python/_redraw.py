@@ -0,0 +1,19 @@
+"""
+Helpers shared by MotorDataPlotter and ACMotorAnimation for rate-limited
+redraws.
+"""
+
+# Redraw at most at the display refresh rate
+REDRAW_INTERVAL = 1.0 / 60
+
+
+def flush(fig, dt=0.0):
+    """
+    Process pending GUI events for fig, then run the GUI event loop for
+    dt seconds. Use this between updates in place of plt.pause, which
+    forces a full redraw of the figure on every call.
+    """
+    canvas = fig.canvas
+    canvas.flush_events()
+    if dt > 0:
+        canvas.start_event_loop(dt)
@@ -1,6 +1,11 @@
 import matplotlib.pyplot as plt 
 from matplotlib.lines import Line2D
+from matplotlib.animation import FuncAnimation
 import numpy as np
+import time
+
+import _redraw
+from _redraw import REDRAW_INTERVAL
 
 plt.ion()  # enable interactive drawing
 
@@ -67,14 +72,37 @@ class MotorDataPlotter:
         if self.num_plots == 1:
             self.ax = [self.ax]
         
-        # Initialize data histories
-        self.time_history = []
-        self.data_histories = {}
-        
-        # Initialize all signal histories based on config
+        # Assign each signal in the config a stable row index
+        self._signal_idx = {}
         for plot in self.plot_config:
             for signal in plot['signals']:
-                self.data_histories[signal] = []
+                self._signal_idx.setdefault(signal, len(self._signal_idx))
+        
+        # Rows of the data buffer shown on each plot. A plot whose signals
+        # occupy consecutive rows gets a slice, so indexing the buffer
+        # yields a view instead of a copy.
+        self._plot_ids = []
+        for plot in self.plot_config:
+            ids = [self._signal_idx[s] for s in plot['signals']]
+            if not ids:
+                self._plot_ids.append(slice(0, 0))
+            elif ids == list(range(ids[0], ids[0] + len(ids))):
+                self._plot_ids.append(slice(ids[0], ids[0] + len(ids)))
+            else:
+                self._plot_ids.append(np.array(ids, dtype=np.intp))
+        
+        # Unit conversion factor of each plot
+        self._plot_conv = [plot.get('conversion', 1.0) for plot in self.plot_config]
+        
+        # Initialize data histories as preallocated ring buffers: one row
+        # per signal in _buf. _n is the write index, _cap the capacity.
+        # Signal values are float32, which is plenty for display and halves
+        # the data moved per frame. Time stays float64 so absolute
+        # timestamps (e.g. time.time()) keep their resolution.
+        self._cap = 1024
+        self._n = 0
+        self.time_history = np.empty(self._cap)
+        self._buf = np.empty((len(self._signal_idx), self._cap), dtype=np.float32)
         
         # Create subplot handles
         self.handle = []
@@ -88,10 +116,49 @@ class MotorDataPlotter:
                     legend=plot.get('legend', None)
                 )
             )
+        
+        # Running min/max of the (converted) data shown in each plot,
+        # covering samples up to _scanned
+        self._ymin = [np.float32(np.inf)] * self.num_plots
+        self._ymax = [np.float32(-np.inf)] * self.num_plots
+        self._scanned = 0
+        
+        self.redraw_interval = REDRAW_INTERVAL
+        self._last_draw = 0.0
+        
+        # Cache the static background of each axes for blitting, and
+        # refresh it whenever the figure is fully redrawn (e.g. on resize)
+        self._bg = None
+        self._paint_lines = True
+        self._canvas = self.fig.canvas
+        self._canvas.mpl_connect('draw_event', self._on_draw)
+        self.fig.canvas.draw()
+    
+    def _on_draw(self, event):
+        """
+        Re-capture the axes backgrounds after a full canvas draw, then paint
+        the animated lines, which a full draw leaves out.
+        Draws made by savefig are ignored: they may use another canvas or
+        dpi, and they already include the animated lines.
+        """
+        if event.canvas is not self._canvas or self._canvas.is_saving():
+            return
+        self._bg = [self._canvas.copy_from_bbox(a.bbox) for a in self.ax]
+        self._bg_renderer = event.renderer
+        if self._paint_lines:
+            self._draw_lines()
+    
+    def _draw_lines(self):
+        """Render the data lines of every subplot into the canvas."""
+        for ax, h in zip(self.ax, self.handle):
+            for artist in h.artists():
+                ax.draw_artist(artist)
     
     def update(self, t: float, **kwargs):
         """
-        Update all plots with new data.
+        Record a new sample and redraw the plots if the last redraw was
+        more than redraw_interval seconds ago. In a manual update loop,
+        pace with plotter.flush(dt) rather than plt.pause.
         
         Parameters:
         -----------
@@ -101,31 +168,185 @@ class MotorDataPlotter:
             Signal values as keyword arguments. 
             Example: theta=1.5, omega=2.0, torque=3.5
         """
+        self.append(t, **kwargs)
+        self._maybe_redraw()
+    
+    def update_batch(self, times, **signals):
+        """
+        Record a batch of samples at once and redraw the plots if the last
+        redraw was more than redraw_interval seconds ago.
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            1D array of sample times
+        **signals : dict
+            Signal arrays as keyword arguments, each the same length as
+            times. Signals left out are recorded as NaN.
+            Example: theta=theta_arr, omega=omega_arr
+        """
+        times = np.asarray(times)
+        n = times.size
+        if n == 0:
+            return
+        for signal_name, values in signals.items():
+            if np.shape(values) != (n,):
+                raise ValueError(f"signal '{signal_name}' has shape {np.shape(values)}, "
+                                 f"expected ({n},) to match times")
+        start, stop = self._n, self._n + n
+        self._grow(stop)
+        
+        # One contiguous write per signal
+        self.time_history[start:stop] = times
+        provided = set()
+        for signal_name, values in signals.items():
+            idx = self._signal_idx.get(signal_name)
+            if idx is not None:
+                self._buf[idx, start:stop] = values
+                provided.add(idx)
+        missing = [i for i in range(self._buf.shape[0]) if i not in provided]
+        if missing:
+            self._buf[missing, start:stop] = np.nan
+        self._n = stop
+        
+        self._maybe_redraw()
+    
+    def flush(self, dt=0.0):
+        """
+        Process pending GUI events, then run the GUI event loop for dt
+        seconds. Use this between updates in place of plt.pause, which
+        forces a full redraw of the figure on every call.
+        """
+        _redraw.flush(self.fig, dt)
+    
+    def _maybe_redraw(self):
+        """Redraw unless the last redraw was under redraw_interval ago."""
+        now = time.perf_counter()
+        if now - self._last_draw > self.redraw_interval:
+            self.redraw()
+            self._last_draw = now
+    
+    def _grow(self, size):
+        """Double the buffer capacity until it can hold size samples."""
+        if size <= self._cap:
+            return
+        while self._cap < size:
+            self._cap *= 2
+        self.time_history = np.resize(self.time_history, self._cap)
+        buf = np.empty((self._buf.shape[0], self._cap), dtype=self._buf.dtype)
+        buf[:, :self._n] = self._buf[:, :self._n]
+        self._buf = buf
+    
+    def append(self, t: float, **kwargs):
+        """
+        Record a new sample without redrawing. Takes the same arguments
+        as update.
+        """
+        n = self._n
+        
+        # Double the buffer capacity when full
+        self._grow(n + 1)
+        
+        # Bind hot attributes to locals for the per-signal loop
+        row_of = self._signal_idx
+        buf = self._buf
+        
         # Update time history
-        self.time_history.append(t)
+        self.time_history[n] = t
         
-        # Update each signal's history
+        # Update each signal's history (NaN if not provided this step)
+        buf[:, n] = np.nan
         for signal_name, value in kwargs.items():
-            if signal_name in self.data_histories:
-                self.data_histories[signal_name].append(value)
-        
-        # Update each plot
-        for i, plot in enumerate(self.plot_config):
-            # Get data for this plot
-            plot_data = []
-            conversion = plot.get('conversion', 1.0)
-            
-            for signal in plot['signals']:
-                if signal in self.data_histories:
-                    # Apply conversion factor (e.g., rad to deg)
-                    converted_data = [val * conversion for val in self.data_histories[signal]]
-                    plot_data.append(converted_data)
-                else:
-                    # If signal not provided, append empty list
-                    plot_data.append([])
+            row = row_of.get(signal_name)
+            if row is not None:
+                buf[row, n] = value
+        self._n += 1
+    
+    def redraw(self):
+        """Push all recorded data to the plots and repaint them."""
+        if self._n == 0:
+            return
+        self._blit(self._push_data())
+    
+    def update_artists(self, t: float, **kwargs):
+        """
+        Record a new sample and return the animated artists, for use as a
+        blitting matplotlib.animation.FuncAnimation frame function.
+        Takes the same arguments as update.
+        """
+        self.append(t, **kwargs)
+        if self._push_data():
+            # The animation caches its background from this draw, so
+            # leave the lines out of it
+            self._paint_lines = False
+            self.fig.canvas.draw()
+            self._paint_lines = True
+        return self.get_artists()
+    
+    def get_artists(self):
+        """Return the line (and legend) artists of every subplot."""
+        return [artist for h in self.handle for artist in h.artists()]
+    
+    def _push_data(self):
+        """
+        Hand the recorded data to each subplot. Returns True if any axes
+        limits changed, so the figure needs a full redraw.
+        """
+        self._scan_ranges()
+        limits_changed = False
+        for i, c in enumerate(self._plot_conv):
+            # Get data for this plot, one row per signal
+            plot_data = self._buf[self._plot_ids[i], :self._n]
+            if c != 1.0:
+                # Apply conversion factor (e.g., rad to deg)
+                plot_data = plot_data * c
             
             # Update the plot
-            self.handle[i].update(self.time_history, plot_data)
+            if self.handle[i].update(self.time_history[:self._n], plot_data,
+                                     self._ymin[i], self._ymax[i]):
+                limits_changed = True
+        return limits_changed
+    
+    def _scan_ranges(self):
+        """
+        Fold the samples recorded since the last scan into the running
+        y-range of each plot.
+        """
+        start, stop = self._scanned, self._n
+        if start == stop:
+            return
+        for i, c in enumerate(self._plot_conv):
+            rows = self._buf[self._plot_ids[i], start:stop]
+            if rows.size == 0:
+                continue
+            if c != 1.0:
+                rows = rows * c
+            lo = np.fmin.reduce(rows, axis=None)
+            hi = np.fmax.reduce(rows, axis=None)
+            if lo < self._ymin[i]:
+                self._ymin[i] = lo
+            if hi > self._ymax[i]:
+                self._ymax[i] = hi
+        self._scanned = stop
+    
+    def _blit(self, full_redraw=False):
+        """
+        Repaint only the data lines over the cached axes backgrounds.
+        A full redraw is needed whenever the axes limits (and hence the
+        ticks) change, or when the canvas renderer was replaced (e.g. by a
+        savefig at another dpi); the draw_event handler then refreshes the
+        backgrounds.
+        """
+        canvas = self._canvas
+        if (full_redraw or self._bg is None
+                or canvas.get_renderer() is not self._bg_renderer):
+            canvas.draw()
+            return
+        for bg in self._bg:
+            canvas.restore_region(bg)
+        self._draw_lines()
+        for ax in self.ax:
+            canvas.blit(ax.bbox)
 
 
 class myPlot:
@@ -158,6 +379,7 @@ class myPlot:
         # '-' solid, '--' dashed, '-.' dash_dot, ':' dotted
 
         self.line = []
+        self.legend_handle = None
 
         # Configure the axes
         self.ax.set_ylabel(ylabel)
@@ -168,34 +390,112 @@ class myPlot:
         # Keeps track of initialization
         self.init = True   
 
-    def update(self, time, data):
+        # Approximate axes width in pixels, used to decimate long histories
+        self._target_px = int(self.ax.bbox.width) or 1200
+
+        # Cached axes limits, grown as data arrives
+        self._xlim = None
+        self._ylim = None
+
+    def update(self, time, data, ymin, ymax):
         """ 
         Adds data to the plot.  
-        time is a list, 
-        data is a list of lists, each list corresponding to a line on the plot
+        time is a 1D array, 
+        data is a 2D array, each row corresponding to a line on the plot
+        ymin, ymax are the running min/max of all data shown on the plot
+        Returns True if the axes limits changed and the figure needs a
+        full redraw.
         """
         if self.init == True:  # Initialize the plot the first time routine is called
+            n_colors = len(self.colors)
+            n_styles = len(self.line_styles)
             for i in range(len(data)):
-                # Instantiate line object and add it to the axes
-                self.line.append(Line2D(time,
-                                        data[i],
-                                        color=self.colors[np.mod(i, len(self.colors))],
-                                        ls=self.line_styles[np.mod(i, len(self.line_styles))],
-                                        label=self.legend[i] if self.legend is not None else None))
+                # Instantiate line object and add it to the axes.
+                # Lines are animated so they are left out of the cached
+                # background and drawn by blitting instead.
+                self.line.append(Line2D([],
+                                        [],
+                                        color=self.colors[i % n_colors],
+                                        ls=self.line_styles[i % n_styles],
+                                        label=self.legend[i] if self.legend is not None else None,
+                                        animated=True))
                 self.ax.add_line(self.line[i])
             self.init = False
-            # add legend if one is specified
+            # add legend if one is specified. It is animated along with
+            # the lines so they are not painted over it.
             if self.legend is not None:
-                self.ax.legend(handles=self.line)
-        else:  # Add new data to the plot
-            # Updates the x and y data of each line.
-            for i in range(len(self.line)):
-                self.line[i].set_xdata(time)
-                self.line[i].set_ydata(data[i])
+                self.legend_handle = self.ax.legend(handles=self.line, loc='upper right')
+                self.legend_handle.set_animated(True)
 
-        # Adjusts the axis to fit all of the data
-        self.ax.relim()
-        self.ax.autoscale()
+        # Add new data to the plot, decimated once the history outgrows
+        # the axes width
+        n = len(time)
+        step = n // self._target_px if n > 2 * self._target_px else 1
+        t_ds = self._decimate_time(time, step)
+        # Updates the x and y data of each line.
+        for i in range(len(self.line)):
+            self.line[i].set_xdata(t_ds)
+            self.line[i].set_ydata(self._decimate_data(data[i], step))
+
+        # Grow the axes limits only when the data leaves them
+        changed = False
+        t0, t1 = time[0], time[-1]
+        if t1 == t0:
+            # A single time stamp has no span to scale from; show a small
+            # window around it and size the axis once the next sample arrives
+            if self._xlim is None:
+                w = 0.05 * max(abs(t0), 1.0)
+                self.ax.set_xlim(t0 - w, t0 + w)
+                changed = True
+        elif self._xlim is None or t1 > self._xlim[1]:
+            # Leave 25% headroom past the data so this happens rarely,
+            # while the growth stays geometric
+            self._xlim = (t0, t0 + 1.25 * (t1 - t0))
+            self.ax.set_xlim(self._xlim)
+            changed = True
+        if np.isfinite(ymin) and (self._ylim is None
+                                  or ymin < self._ylim[0]
+                                  or ymax > self._ylim[1]):
+            # Pad the data range by 5% so small excursions don't rescale
+            pad = 0.05 * (ymax - ymin) or 0.05 * max(abs(ymax), 1.0)
+            self._ylim = (ymin - pad, ymax + pad)
+            self.ax.set_ylim(self._ylim)
+            changed = True
+        return changed
+
+    def artists(self):
+        """Return the animated artists of this subplot, drawn in order."""
+        if self.legend_handle is None:
+            return self.line
+        return self.line + [self.legend_handle]
+
+    @staticmethod
+    def _decimate_time(time, step):
+        """
+        Time samples matching _decimate_data: the start of each bucket of
+        `step` samples, repeated for the bucket's min and max, followed by
+        any samples left over in a trailing partial bucket.
+        """
+        if step == 1:
+            return time
+        m = (len(time) // step) * step
+        return np.concatenate((np.repeat(time[:m:step], 2), time[m:]))
+
+    @staticmethod
+    def _decimate_data(y, step):
+        """
+        Envelope-preserving downsample: each bucket of `step` samples is
+        replaced by its min and max so peaks survive decimation.
+        """
+        if step == 1:
+            return y
+        m = (len(y) // step) * step
+        buckets = y[:m].reshape(-1, step)
+        envelope = np.empty(2 * buckets.shape[0], dtype=y.dtype)
+        # fmin/fmax ignore NaN (skipped samples) unless a whole bucket is NaN
+        envelope[0::2] = np.fmin.reduce(buckets, axis=1)
+        envelope[1::2] = np.fmax.reduce(buckets, axis=1)
+        return np.concatenate((envelope, y[m:]))
 
 
 # ==============================================================================
@@ -203,33 +503,34 @@ class myPlot:
 # ==============================================================================
 
 if __name__ == "__main__":
-    import time
-    
     # Example 1: Using default motor configuration
     print("Example 1: Default motor configuration")
     plotter1 = MotorDataPlotter()
     
-    # Simulate motor operation
-    for i in range(100):
-        t = i * 0.01
-        theta_ref = np.pi/4 * np.sin(0.5 * t)
-        theta = theta_ref + 0.1 * np.sin(5 * t)
-        omega = 0.5 * np.pi/4 * np.cos(0.5 * t)
-        current_d = 2.0 + 0.5 * np.sin(t)
-        current_q = 3.0 + 0.8 * np.cos(t)
-        torque = 5.0 * np.sin(t)
-        
-        plotter1.update(
-            t=t,
-            theta_ref=theta_ref,
-            theta=theta,
-            omega=omega,
-            current_d=current_d,
-            current_q=current_q,
-            torque=torque
+    # Simulate motor operation (all samples computed up front)
+    t = np.arange(100) * 0.01
+    theta_ref = np.pi/4 * np.sin(0.5 * t)
+    theta = theta_ref + 0.1 * np.sin(5 * t)
+    omega = 0.5 * np.pi/4 * np.cos(0.5 * t)
+    current_d = 2.0 + 0.5 * np.sin(t)
+    current_q = 3.0 + 0.8 * np.cos(t)
+    torque = 5.0 * np.sin(t)
+    
+    def frame1(i):
+        return plotter1.update_artists(
+            t=t[i],
+            theta_ref=theta_ref[i],
+            theta=theta[i],
+            omega=omega[i],
+            current_d=current_d[i],
+            current_q=current_q[i],
+            torque=torque[i]
         )
-        
-        plt.pause(0.001)
+    
+    # Play the samples back at 60 frames per second, blitting the lines
+    ani1 = FuncAnimation(plotter1.fig, frame1, frames=len(t),
+                         init_func=plotter1.get_artists, interval=1000/60,
+                         blit=True, repeat=False, cache_frame_data=False)
     
     # Example 2: Custom configuration
     print("\nExample 2: Custom configuration for different motor application")
@@ -259,22 +560,31 @@ if __name__ == "__main__":
     
     plotter2 = MotorDataPlotter(plot_config=custom_config)
     
-    # Simulate different motor
-    for i in range(100):
-        t = i * 0.01
-        
-        plotter2.update(
-            t=t,
-            position_ref=0.5 * t,
-            position=0.5 * t + 0.01 * np.sin(10 * t),
-            velocity=0.5 + 0.1 * np.cos(10 * t),
-            voltage_a=120 * np.sin(2 * np.pi * 60 * t),
-            voltage_b=120 * np.sin(2 * np.pi * 60 * t - 2*np.pi/3),
-            voltage_c=120 * np.sin(2 * np.pi * 60 * t + 2*np.pi/3),
-            force=100 + 20 * np.sin(t)
+    # Simulate different motor (all samples computed up front)
+    t2 = np.arange(100) * 0.01
+    position_ref = 0.5 * t2
+    position = 0.5 * t2 + 0.01 * np.sin(10 * t2)
+    velocity = 0.5 + 0.1 * np.cos(10 * t2)
+    voltage_a = 120 * np.sin(2 * np.pi * 60 * t2)
+    voltage_b = 120 * np.sin(2 * np.pi * 60 * t2 - 2*np.pi/3)
+    voltage_c = 120 * np.sin(2 * np.pi * 60 * t2 + 2*np.pi/3)
+    force = 100 + 20 * np.sin(t2)
+    
+    def frame2(i):
+        return plotter2.update_artists(
+            t=t2[i],
+            position_ref=position_ref[i],
+            position=position[i],
+            velocity=velocity[i],
+            voltage_a=voltage_a[i],
+            voltage_b=voltage_b[i],
+            voltage_c=voltage_c[i],
+            force=force[i]
         )
-        
-        plt.pause(0.001)
     
-    print("\nPlotting complete. Close windows to exit.")
+    ani2 = FuncAnimation(plotter2.fig, frame2, frames=len(t2),
+                         init_func=plotter2.get_artists, interval=1000/60,
+                         blit=True, repeat=False, cache_frame_data=False)
+    
+    print("\nClose windows to exit.")
     plt.show(block=True)
\ No newline at end of file
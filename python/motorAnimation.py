@@ -1,8 +1,25 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
 from matplotlib.widgets import Button
+from matplotlib.animation import FuncAnimation
 import numpy as np
 import signal
+import time
+
+import _redraw
+from _redraw import REDRAW_INTERVAL
+
+try:
+    # Ahead-of-time compiled kernels, built by running _motor_kernels.py
+    from motor_kernels import rotor_pose as _rotor_pose
+except ImportError:
+    from _motor_kernels import rotor_pose as _rotor_pose
+    try:
+        from numba import njit
+        _rotor_pose = njit(cache=True, fastmath=True)(_rotor_pose)
+    except ImportError:  # numba is optional; fall back to plain Python
+        pass
 
 # if you are having difficulty with the graphics,
 # try using one of the following backends.
@@ -32,6 +49,33 @@ class ACMotorAnimation:
         self.rotor_radius = rotor_radius
         self.shaft_radius = shaft_radius
         
+        # Fixed rotor-bar geometry: 8 bars evenly spaced around the rotor
+        self._bar_offsets = np.arange(8, dtype=np.float64) * (2 * np.pi / 8)
+        self._r_inner = shaft_radius + 0.05
+        self._r_outer = rotor_radius - 0.05
+        
+        # Preallocated rotor-bar endpoint buffers filled by _rotor_pose
+        n_bars = self._bar_offsets.size
+        self._xi = np.empty(n_bars)
+        self._xo = np.empty(n_bars)
+        self._yi = np.empty(n_bars)
+        self._yo = np.empty(n_bars)
+        self._bar_segs = np.empty((n_bars, 2, 2))
+        
+        # Reusable endpoint buffers for the shaft reference mark
+        self._ref_x = np.zeros(2)
+        self._ref_y = np.zeros(2)
+        
+        # _state holds the latest (theta, omega, torque) for the state text
+        self.redraw_interval = REDRAW_INTERVAL
+        self._last_draw = 0.0
+        self._state = None
+        
+        # The state text is relaid out on every change, so refresh it
+        # less often than the rotor
+        self.text_interval = 0.25
+        self._last_text_t = 0.0
+        
         # Initializes a figure and axes object
         self.fig, self.ax = plt.subplots(figsize=(8, 8))
         
@@ -47,6 +91,11 @@ class ACMotorAnimation:
         self.ax.set_xlabel('Position (m)')
         self.ax.set_ylabel('Position (m)')
         self.ax.set_title('AC Motor Visualization')
+        
+        # Motor state readout. It sits inside the axes (unlike the title)
+        # so it can be blitted along with the rotor.
+        self._state_text = self.ax.text(0.02, 0.98, '', transform=self.ax.transAxes,
+                                        ha='left', va='top', animated=True)
 
         # Create exit button
         self.button_ax = plt.axes([0.8, 0.805, 0.1, 0.075])
@@ -58,9 +107,19 @@ class ACMotorAnimation:
         # Register <ctrl+c> signal handler to stop the simulation
         signal.signal(signal.SIGINT, signal.SIG_DFL)
 
+        # Cache the static background for blitting the moving artists,
+        # refreshed whenever the figure is fully redrawn (e.g. on resize).
+        # _paint_artists is cleared when FuncAnimation does the blitting.
+        self._bg = None
+        self._paint_artists = True
+        self._canvas = self.fig.canvas
+        self._canvas.mpl_connect('draw_event', self._on_draw)
+
     def update(self, theta, omega=None, torque=None):
         """
-        Update the motor animation
+        Update the motor animation, redrawing the figure if the last
+        redraw was more than redraw_interval seconds ago. In a manual
+        update loop, pace with anim.flush(dt) rather than plt.pause.
         
         Parameters:
         -----------
@@ -71,35 +130,122 @@ class ACMotorAnimation:
         torque : float, optional
             Motor torque in N-m (for display)
         """
+        self.append(theta, omega, torque)
+        now = time.perf_counter()
+        if now - self._last_draw > self.redraw_interval:
+            self.redraw()
+            self._last_draw = now
+
+    def append(self, theta, omega=None, torque=None):
+        """
+        Move the rotor to theta without redrawing. Takes the same
+        arguments as update.
+        """
+        sx, sy = _rotor_pose(theta, self._bar_offsets,
+                             self._r_inner, self._r_outer, self.shaft_radius,
+                             self._xi, self._xo, self._yi, self._yo)
         self.drawStator()
-        self.drawRotor(theta)
-        self.drawShaft(theta)
+        self.drawRotor(self._xi, self._xo, self._yi, self._yo)
+        self.drawShaft(sx, sy)
+        self._state = (theta, omega, torque)
         
-        # Update title with motor state if provided
+        # After each function has been called, initialization is over.
+        # The static patches were just added, so the background is stale.
+        if self.flagInit:
+            self.flagInit = False
+            self._bg = None
+
+    def redraw(self):
+        """
+        Update the motor state text and blit the moving artists over the
+        cached background.
+        """
+        if self._state is None:
+            return
+        self._refresh_state_text()
+        canvas = self._canvas
+        if self._bg is None or canvas.get_renderer() is not self._bg_renderer:
+            # The draw_event handler captures the background and paints
+            # the moving artists. A savefig at another dpi replaces the
+            # renderer, so the cached background no longer applies.
+            canvas.draw()
+            return
+        canvas.restore_region(self._bg)
+        self._draw_artists()
+        canvas.blit(self.ax.bbox)
+
+    def _on_draw(self, event):
+        """
+        Re-capture the axes background after a full canvas draw, then paint
+        the animated artists, which a full draw leaves out.
+        Draws made by savefig are ignored: they may use another canvas or
+        dpi, and they already include the animated artists.
+        """
+        if event.canvas is not self._canvas or self._canvas.is_saving():
+            return
+        self._bg = self._canvas.copy_from_bbox(self.ax.bbox)
+        self._bg_renderer = event.renderer
+        if self._paint_artists and not self.flagInit:
+            self._draw_artists()
+
+    def _draw_artists(self):
+        """Render the moving artists into the canvas."""
+        for artist in (self._bars_lc, self.ref_mark, self._state_text):
+            self.ax.draw_artist(artist)
+
+    def update_artists(self, theta, omega=None, torque=None):
+        """
+        Move the rotor to theta and return the artists that changed, for
+        use as a blitting matplotlib.animation.FuncAnimation frame
+        function. Takes the same arguments as update.
+        """
+        # The animation caches its own backgrounds, which must not
+        # contain the moving artists
+        self._paint_artists = False
+        self.append(theta, omega, torque)
+        self._refresh_state_text()
+        return [self._bars_lc, self.ref_mark, self._state_text]
+
+    def flush(self, dt=0.0):
+        """
+        Process pending GUI events, then run the GUI event loop for dt
+        seconds. Use this between updates in place of plt.pause, which
+        forces a full redraw of the figure on every call.
+        """
+        _redraw.flush(self.fig, dt)
+
+    def _refresh_state_text(self):
+        """
+        Show the latest motor state, at most every text_interval seconds
+        """
+        now = time.perf_counter()
+        if now - self._last_text_t <= self.text_interval:
+            return
+        self._last_text_t = now
+        
+        theta, omega, torque = self._state
+        # Update text with motor state if provided
         if omega is not None and torque is not None:
-            self.ax.set_title(f'AC Motor: θ={theta:.2f} rad, ω={omega:.2f} rad/s, τ={torque:.2f} N-m')
+            self._state_text.set_text(f'θ={theta:.2f} rad, ω={omega:.2f} rad/s, τ={torque:.2f} N-m')
         elif omega is not None:
-            self.ax.set_title(f'AC Motor: θ={theta:.2f} rad, ω={omega:.2f} rad/s')
+            self._state_text.set_text(f'θ={theta:.2f} rad, ω={omega:.2f} rad/s')
         else:
-            self.ax.set_title(f'AC Motor: θ={theta:.2f} rad')
-        
-        # After each function has been called, initialization is over
-        if self.flagInit:
-            self.flagInit = False
+            self._state_text.set_text(f'θ={theta:.2f} rad')
 
     def drawStator(self):
         """Draw the stationary stator with windings"""
-        # Outer stator casing
-        stator_outer = plt.Circle((0, 0), self.stator_radius, 
-                                  color='gray', fill=True, alpha=0.3,
-                                  edgecolor='black', linewidth=2)
-        
-        # Inner stator boundary
-        stator_inner = plt.Circle((0, 0), self.rotor_radius + 0.05,
-                                  color='white', fill=True,
-                                  edgecolor='black', linewidth=1)
-        
+        # The stator never moves, so it is only created once
         if self.flagInit:
+            # Outer stator casing
+            stator_outer = plt.Circle((0, 0), self.stator_radius, 
+                                      color='gray', fill=True, alpha=0.3,
+                                      edgecolor='black', linewidth=2)
+            
+            # Inner stator boundary
+            stator_inner = plt.Circle((0, 0), self.rotor_radius + 0.05,
+                                      color='white', fill=True,
+                                      edgecolor='black', linewidth=1)
+            
             self.handle.append(stator_outer)
             self.handle.append(stator_inner)
             self.ax.add_patch(self.handle[0])
@@ -107,101 +253,87 @@ class ACMotorAnimation:
             
             # Draw stator windings (fixed positions)
             # 6 stator poles (3-phase motor)
+            angles = np.arange(6) * (np.pi / 3)
+            xs = (self.stator_radius - 0.15) * np.cos(angles)
+            ys = (self.stator_radius - 0.15) * np.sin(angles)
             for i in range(6):
-                angle = i * np.pi / 3
-                x = (self.stator_radius - 0.15) * np.cos(angle)
-                y = (self.stator_radius - 0.15) * np.sin(angle)
-                
                 # Winding coil representation
-                coil = plt.Circle((x, y), 0.08, 
+                coil = plt.Circle((xs[i], ys[i]), 0.08, 
                                  color=['red', 'yellow', 'blue'][i % 3],
                                  alpha=0.7, edgecolor='black', linewidth=1)
                 self.handle.append(coil)
                 self.ax.add_patch(self.handle[-1])
 
-    def drawRotor(self, theta):
-        """Draw the rotating rotor with bars"""
-        # Main rotor body
-        rotor_body = plt.Circle((0, 0), self.rotor_radius,
-                               color='lightblue', fill=True, alpha=0.6,
-                               edgecolor='black', linewidth=2)
-        
+    def drawRotor(self, xs_in, xs_out, ys_in, ys_out):
+        """Draw the rotating rotor with bars between the given endpoints"""
         if self.flagInit:
+            # Main rotor body (static, centered at the origin)
+            rotor_body = plt.Circle((0, 0), self.rotor_radius,
+                                   color='lightblue', fill=True, alpha=0.6,
+                                   edgecolor='black', linewidth=2)
             self.handle.append(rotor_body)
             self.ax.add_patch(self.handle[-1])
             
             # Create rotor bars (squirrel cage representation)
-            # 8 rotor bars
-            self.rotor_bar_handles = []
-            for i in range(8):
-                line_handle, = self.ax.plot([], [], 'k-', linewidth=3)
-                self.rotor_bar_handles.append(line_handle)
-                self.handle.append(line_handle)
-        
-        # Update rotor bars based on theta
-        for i, line_handle in enumerate(self.rotor_bar_handles):
-            angle = theta + i * 2 * np.pi / 8
-            r_inner = self.shaft_radius + 0.05
-            r_outer = self.rotor_radius - 0.05
-            
-            x = [r_inner * np.cos(angle), r_outer * np.cos(angle)]
-            y = [r_inner * np.sin(angle), r_outer * np.sin(angle)]
-            
-            line_handle.set_data(x, y)
-
-    def drawShaft(self, theta):
-        """Draw the motor shaft with a reference mark"""
-        # Main shaft
-        shaft = plt.Circle((0, 0), self.shaft_radius,
-                          color='darkgray', fill=True,
-                          edgecolor='black', linewidth=2)
+            # 8 rotor bars drawn as a single collection
+            self._bars_lc = LineCollection(np.zeros((self._bar_offsets.size, 2, 2)),
+                                           colors='k', linewidths=3, animated=True)
+            self.ax.add_collection(self._bars_lc)
+            self.handle.append(self._bars_lc)
         
+        # Update rotor bars, one (inner, outer) segment per bar
+        segs = self._bar_segs
+        segs[:, 0, 0] = xs_in
+        segs[:, 1, 0] = xs_out
+        segs[:, 0, 1] = ys_in
+        segs[:, 1, 1] = ys_out
+        self._bars_lc.set_segments(segs)
+
+    def drawShaft(self, x, y):
+        """Draw the motor shaft with a reference mark ending at (x, y)"""
         if self.flagInit:
+            # Main shaft (static, centered at the origin)
+            shaft = plt.Circle((0, 0), self.shaft_radius,
+                              color='darkgray', fill=True,
+                              edgecolor='black', linewidth=2)
             self.handle.append(shaft)
             self.ax.add_patch(self.handle[-1])
             
             # Reference mark on shaft (to show rotation)
-            self.ref_mark, = self.ax.plot([], [], 'r-', linewidth=3)
+            self.ref_mark, = self.ax.plot([], [], 'r-', linewidth=3, animated=True)
             self.handle.append(self.ref_mark)
         
         # Update reference mark
-        x = [0, self.shaft_radius * np.cos(theta)]
-        y = [0, self.shaft_radius * np.sin(theta)]
-        self.ref_mark.set_data(x, y)
+        self._ref_x[1] = x
+        self._ref_y[1] = y
+        self.ref_mark.set_data(self._ref_x, self._ref_y)
 
 
 # Example usage and testing
 if __name__ == "__main__":
-    import time
-    
     # Create animation object
     anim = ACMotorAnimation(stator_radius=1.0, rotor_radius=0.6, shaft_radius=0.15)
     
     # Simulation parameters
-    dt = 0.05  # time step
-    t = 0
-    theta = 0
+    dt = 1.0 / 60  # time step, one per displayed frame
     omega = 2.0  # angular velocity (rad/s)
     
-    plt.ion()  # Turn on interactive mode
-    plt.show()
+    def frame(i):
+        # Motor state at frame i
+        theta = i * omega * dt
+        torque = 5.0 * np.sin(2 * i * dt)  # Example varying torque
+        return anim.update_artists(theta, omega, torque)
+    
+    # Draw the initial pose so the static patches exist before the
+    # animation caches its background
+    frame(0)
+    
+    # Animation loop, blitting only the moving artists
+    ani = FuncAnimation(anim.fig, frame, interval=1000 * dt,
+                        blit=True, cache_frame_data=False)
     
-    # Animation loop
     try:
-        while True:
-            # Update motor state
-            theta += omega * dt
-            torque = 5.0 * np.sin(2 * t)  # Example varying torque
-            
-            # Update animation
-            anim.update(theta, omega, torque)
-            
-            # Redraw
-            plt.pause(dt)
-            
-            # Update time
-            t += dt
-            
+        plt.show()
     except KeyboardInterrupt:
         print("\nSimulation stopped by user")
         plt.close()
\ No newline at end of file
@@ -1,20 +1,81 @@
+from typing import NamedTuple
+
 import numpy as np
 
-Kt = .61 # NM/A_rms
-Kv_no_load = 15.53 * 2 * np.pi / 60 #kv for no load in w/s
-Kv_load = 12.05 * 2 *  np.pi / 60 #kv for nominal load w/s
-Kv_peak = .68 * 2 * np.pi / 60 #kv for peak load w/s 
-Ld = 96.5 * 10 ** -6 #96.5 uH
-Lq = Ld # Lq ~ Ld
-p = 10 #pole pairs
-Tau = 130 # NM
-R = 7.06 * 10 ** 3
-flux = .03737
-J = 0.02521 #kg/m^2
-#winding configuration: star
 
+class MotorParams(NamedTuple):
+    """
+    EMRAX 228 MV motor constants, including derived quantities so control
+    loops read them instead of recomputing. Build instances with
+    make_params() so the derived fields stay consistent.
+    A NamedTuple can be passed to (or read as a global by) numba @njit
+    functions, which then treat the fields as constants.
+    """
+    Kt: float # NM/A_rms
+    Kv_no_load: float #kv for no load in w/s
+    Kv_load: float #kv for nominal load w/s
+    Kv_peak: float #kv for peak load w/s
+    Ld: float # H
+    Lq: float # H
+    p: int #pole pairs
+    Tau: float # NM
+    R: float
+    flux: float
+    J: float #kg/m^2
+    Tau_max: float #Nm
+    S_max: float #rpm
+
+    # Derived quantities
+    w_max: float # max mechanical speed, rad/s
+    w_e: float # max electrical speed, rad/s
+    inv_Ld: float
+    inv_Lq: float
+    Lq_minus_Ld: float
+    three_over_two_p: float # torque constant 3/2 * p
+
+
+def make_params(Kt=.61,
+                Kv_no_load=15.53 * 2 * np.pi / 60,
+                Kv_load=12.05 * 2 * np.pi / 60,
+                Kv_peak=.68 * 2 * np.pi / 60,
+                Ld=96.5 * 10 ** -6, #96.5 uH
+                Lq=None, # Lq ~ Ld unless given
+                p=10,
+                Tau=130,
+                R=7.06 * 10 ** 3,
+                flux=.03737,
+                J=0.02521,
+                Tau_max=220,
+                S_max=6500):
+    """Build a MotorParams, computing the derived quantities."""
+    if Lq is None:
+        Lq = Ld
+    w_max = S_max * 2 * np.pi / 60
+    return MotorParams(Kt=Kt, Kv_no_load=Kv_no_load, Kv_load=Kv_load,
+                       Kv_peak=Kv_peak, Ld=Ld, Lq=Lq, p=p, Tau=Tau, R=R,
+                       flux=flux, J=J, Tau_max=Tau_max, S_max=S_max,
+                       w_max=w_max, w_e=w_max * p,
+                       inv_Ld=1.0 / Ld, inv_Lq=1.0 / Lq,
+                       Lq_minus_Ld=Lq - Ld, three_over_two_p=1.5 * p)
+
+
+PARAMS = make_params()
+
+# Module-level names, kept for existing callers
+Kt = PARAMS.Kt
+Kv_no_load = PARAMS.Kv_no_load
+Kv_load = PARAMS.Kv_load
+Kv_peak = PARAMS.Kv_peak
+Ld = PARAMS.Ld
+Lq = PARAMS.Lq
+p = PARAMS.p
+Tau = PARAMS.Tau
+R = PARAMS.R
+flux = PARAMS.flux
+J = PARAMS.J
+#winding configuration: star
 
-Tau_max = 220 #Nm
-S_max = 6500 #rpm
-w_max = S_max * 2 * np.pi /60
-w_e = w_max * 10
\ No newline at end of file
+Tau_max = PARAMS.Tau_max
+S_max = PARAMS.S_max
+w_max = PARAMS.w_max
+w_e = PARAMS.w_e